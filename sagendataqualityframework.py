@@ -1,17 +1,133 @@
 """Framework for data quality validation using Great Expectations."""
 
-from typing import Optional, List, Dict, Any, Union
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Callable, Iterator, Mapping, NamedTuple, Set, Tuple
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import logging
 import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from types import MappingProxyType
 
-import great_expectations as gx
-from great_expectations.core import RunIdentifier
-from great_expectations.core.batch_definition import BatchDefinition
-from great_expectations.checkpoint.actions import UpdateDataDocsAction
-from great_expectations.core.expectation_suite import ExpectationSuite
-import os
+if TYPE_CHECKING:
+    from great_expectations.core.batch_definition import BatchDefinition
+    from great_expectations.core.expectation_suite import ExpectationSuite
+
+
+_logger = logging.getLogger(__name__)
+
+# great_expectations is imported on first use; importing it eagerly costs
+# hundreds of ms even when callers only introspect this module.
+_gx = None
+
+
+def _get_gx() -> Any:
+    """Return the great_expectations module, importing it on first call."""
+    global _gx
+    if _gx is None:
+        import great_expectations
+        _gx = great_expectations
+    return _gx
+
+
+# Working directory at import time, used when no project_root_dir is given.
+_DEFAULT_ROOT = os.path.realpath(os.getcwd())
+
+# Live contexts shared across instances, keyed by (mode, realpath(project_root_dir)).
+_CONTEXT_CACHE: Dict[Tuple[str, str], Any] = {}
+_CONTEXT_LOCK = threading.Lock()
+
+# Batch definitions created by set_partitioned_batch_definition, as
+# (data source, data asset, batch definition) names, per context key. In file
+# mode they are also listed in _PARTITIONS_FILE under the project's
+# uncommitted directory, so other processes know them too.
+_PARTITION_REGISTRY: Dict[Tuple[str, str], Set[Tuple[str, str, str]]] = {}
+_PARTITION_LOCK = threading.Lock()
+_PARTITIONS_FILE = "sagen_partitioned_batch_definitions.json"
+
+# Checkpoint results persisted across processes by run_checkpoint(use_cache=True).
+_RESULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".sagen_dq_cache")
+
+
+def _wrap_errors(message: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Re-raise unexpected errors from the decorated method as ValueError.
+
+    ValueErrors pass through untouched so argument validation keeps its message.
+    Any other exception is wrapped as ``ValueError(f"{message}: {e}")`` with the
+    original chained as ``__cause__``. ``message`` may reference the method's
+    arguments by name, e.g. ``"Failed to create data source '{data_source_name}'"``;
+    it is only formatted when an error occurs.
+
+    Args:
+        message: Prefix for the wrapped error message.
+    """
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return fn(*args, **kwargs)
+            except ValueError:
+                raise
+            except Exception as e:
+                bound = signature.bind_partial(*args, **kwargs)
+                bound.apply_defaults()
+                raise ValueError(f"{message.format(**bound.arguments)}: {e}") from e
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=8)
+def _default_actions(site_name: str) -> Tuple[Any, ...]:
+    """Return the default checkpoint actions for a Data Docs site, built once per site."""
+    from great_expectations.checkpoint.actions import UpdateDataDocsAction
 
+    return (UpdateDataDocsAction(name=f"Update Data Docs for {site_name}", site_names=[site_name]),)
 
 
+def _without_ids(value: Any) -> Any:
+    """Return a copy of a JSON-like value with every ``"id"`` key removed."""
+    if isinstance(value, dict):
+        return {key: _without_ids(item) for key, item in value.items() if key != "id"}
+    if isinstance(value, list):
+        return [_without_ids(item) for item in value]
+    return value
+
+
+def _require(**arguments: Any) -> None:
+    """Raise ValueError naming the first empty argument, e.g. ``_require(suite_name=suite_name)``."""
+    for name, value in arguments.items():
+        if not value:
+            raise ValueError(f"{name} cannot be empty")
+
+
+class Pipeline(NamedTuple):
+    """Objects registered by SagenDataQuality.build_pipeline."""
+
+    suite: Any
+    batch_definition: Any
+    validation_definition: Any
+    checkpoint: Any
+
+
+class _ExpectationBatch:
+    """Expectations queued by SagenDataQuality.batch_expectations."""
+
+    __slots__ = ("expectations",)
+
+    def __init__(self) -> None:
+        self.expectations: List[Any] = []
+
+    def add(self, expectation: Any) -> None:
+        """Queue an expectation to be added when the batch closes."""
+        self.expectations.append(expectation)
+
 
 class SagenDataQuality:
     """A class to manage data quality validation using Great Expectations.
@@ -22,31 +138,246 @@ class SagenDataQuality:
 
     Args:
         df: The pandas DataFrame to validate.
-        mode (str, optional): The context mode. Defaults to "file".
+        mode (str, optional): The context mode. Defaults to "file" when project_root_dir
+            is given and "ephemeral" otherwise. Ephemeral contexts keep everything in
+            memory and skip store writes; Data Docs need "file" mode, so checkpoints
+            created in an ephemeral context get no default actions.
         project_root_dir (str, optional): The root directory for the Great Expectations project.
-            Defaults to current working directory.
+            Defaults to the working directory at import time.
+        downcast (bool, optional): Shrink numeric dtypes and convert low-cardinality
+            object columns to ``category`` before validation. Float columns become
+            ``float32`` only when every value is exactly representable in it.
+            Defaults to False.
+        arrow_backed (bool, optional): Convert the DataFrame to PyArrow-backed dtypes
+            once, so string columns are held in Arrow buffers instead of Python
+            objects for every batch built from it. Requires pyarrow. Defaults to False.
+        freeze_df (bool, optional): If True, the NumPy arrays backing the DataFrame
+            are marked read-only, so anything that tries to mutate them in place
+            (including Great Expectations, which receives the frame without a copy
+            either way) raises. This changes the caller's DataFrame in place and
+            permanently, unless downcast or arrow_backed already replaced it with
+            a new frame. Defaults to False.
+        site_map (dict, optional): Maps action list names to the Data Docs site their
+            default action updates. Defaults to SITE_MAP.
+        default_site (str, optional): Data Docs site for action lists not in site_map.
+            Defaults to DEFAULT_SITE.
 
     Attributes:
         df: The input DataFrame.
+        mode: The resolved context mode.
         context: The Great Expectations context.
-        batch_parameters: Parameters for batch processing.
+        batch_parameters: Parameters for batch processing. Read-only so it can be
+            shared safely across threads in run_checkpoints.
     """
 
-    def __init__(self, df, mode: str = "file", project_root_dir: Optional[str] = None) -> None:
+    # Every instance attribute must be listed here and set in __init__; subclasses
+    # that need extra attributes must declare their own __slots__.
+    __slots__ = (
+        "_df",
+        "_batch_parameters",
+        "_batch_parameters_view",
+        "_batch_cache",
+        "_partitions",
+        "_df_summary",
+        "project_root_dir",
+        "mode",
+        "context",
+        "_ds_cache",
+        "_asset_cache",
+        "_bd_cache",
+        "_suite_cache",
+        "_vd_cache",
+        "_action_list_cache",
+        "_result_cache",
+        "_pending_docs",
+        "_dirty_suites",
+        "_cache_lock",
+        "_bulk_queue",
+        "_site_map",
+        "_default_site",
+    )
+
+    SITE_MAP: Dict[str, str] = {"delq_history_checkpoint_dev_actions": "local_site1"}
+    DEFAULT_SITE = "local_site2"
+
+    def __init__(
+        self,
+        df,
+        mode: Optional[str] = None,
+        project_root_dir: Optional[str] = None,
+        downcast: bool = False,
+        freeze_df: bool = False,
+        arrow_backed: bool = False,
+        site_map: Optional[Dict[str, str]] = None,
+        default_site: Optional[str] = None
+    ) -> None:
         if df is None:
             raise ValueError("DataFrame cannot be None")
+        if downcast:
+            df = self._downcast(df)
+        if arrow_backed:
+            df = df.convert_dtypes(dtype_backend="pyarrow")
+        if freeze_df:
+            self._freeze(df)
         
+        self._cache_lock = threading.RLock()
+        self._batch_cache: Dict[Tuple[int, Tuple[str, str, str]], Any] = {}
+        self._partitions: Dict[Tuple[str, str, str], Any] = {}
+        self._df_summary: Optional[Dict[str, Any]] = None
         self.df = df
-        self.project_root_dir = project_root_dir if project_root_dir else os.getcwd()
+        if mode is None:
+            mode = "file" if project_root_dir else "ephemeral"
+        self.mode = mode
+        self.project_root_dir = os.path.realpath(project_root_dir) if project_root_dir else _DEFAULT_ROOT
         self.context = self._initialize_context(mode=mode, project_root_dir=self.project_root_dir)
-        self.batch_parameters = {"dataframe": df}
+        self._ds_cache: Dict[str, Any] = {}
+        self._asset_cache: Dict[Tuple[str, str], Any] = {}
+        self._bd_cache: Dict[Tuple[str, str, str], Any] = {}
+        self._suite_cache: Dict[str, Any] = {}
+        self._vd_cache: Dict[str, Any] = {}
+        self._action_list_cache: Dict[str, List[Any]] = {}
+        self._result_cache: Dict[str, Any] = {}
+        self._pending_docs: List[Any] = []
+        self._dirty_suites: Dict[str, Any] = {}
+        self._bulk_queue: Optional[List[Tuple[str, Any]]] = None
+        self._site_map = site_map if site_map is not None else self.SITE_MAP
+        self._default_site = default_site or self.DEFAULT_SITE
+
+    @property
+    def df(self) -> Any:
+        """The DataFrame being validated."""
+        return self._df
+
+    @df.setter
+    def df(self, df: Any) -> None:
+        if df is None:
+            raise ValueError("DataFrame cannot be None")
+        self._df = df
+        # Built once per frame and never mutated; GX receives this dict and
+        # callers get a read-only view of it.
+        self._batch_parameters = {"dataframe": df}
+        self._batch_parameters_view = MappingProxyType(self._batch_parameters)
+        self._batch_cache.clear()
+        # Partition row positions and the column summary refer to the previous frame.
+        self._partitions.clear()
+        self._df_summary = None
+
+    def _get_df_summary(self) -> Dict[str, Any]:
+        """Return dtypes, null counts and distinct counts of ``self.df``.
+
+        Computed in one pass on first use and reused until ``df`` is reassigned.
+        """
+        if self._df_summary is None:
+            self._df_summary = {
+                "dtypes": self.df.dtypes.to_dict(),
+                "null_counts": self.df.isna().sum().to_dict(),
+                "nunique": self.df.nunique().to_dict(),
+                "nrows": len(self.df),
+            }
+        return self._df_summary
 
+    def get_column_profile(self, column: str) -> Dict[str, Any]:
+        """Return the dtype, null count and distinct count of a column.
+
+        Values come from a summary of ``self.df`` computed once, so building many
+        column-level expectations does not rescan the frame.
+
+        Args:
+            column: Name of the column.
+
+        Returns:
+            A dict with the column's ``dtype``, ``null_count``, ``nunique`` and
+            the frame's ``nrows``.
+
+        Raises:
+            ValueError: If the column does not exist.
+        """
+        summary = self._get_df_summary()
+        if column not in summary["dtypes"]:
+            raise ValueError(f"Column '{column}' not found in DataFrame")
+        return {
+            "dtype": summary["dtypes"][column],
+            "null_count": summary["null_counts"][column],
+            "nunique": summary["nunique"][column],
+            "nrows": summary["nrows"],
+        }
+
+    @staticmethod
+    def _downcast(df: Any, category_ratio: float = 0.5) -> Any:
+        """Return a copy of df with smaller dtypes.
+
+        Integer columns are downcast with ``pd.to_numeric``, float columns become
+        ``float32`` when every value is exactly representable in it, and object
+        columns whose unique-value ratio is below ``category_ratio`` become
+        ``category``.
+
+        Args:
+            df: The pandas DataFrame to shrink.
+            category_ratio: Maximum unique/rows ratio for converting an object
+                column to ``category``. Defaults to 0.5.
+
+        Returns:
+            The downcast DataFrame.
+        """
+        import numpy as np
+        import pandas as pd
+
+        before = df.memory_usage(deep=True).sum()
+        df = df.copy()
+        for column in df.select_dtypes("integer"):
+            df[column] = pd.to_numeric(df[column], downcast="integer")
+        for column in df.select_dtypes("float"):
+            # Not pd.to_numeric(downcast="float"): it accepts values that only
+            # survive float32 approximately.
+            values = df[column]
+            if values.dtype.itemsize <= 4:
+                continue
+            with np.errstate(over="ignore"):
+                narrowed = values.astype("float32" if isinstance(values.dtype, np.dtype) else "Float32")
+            if ((narrowed == values) | values.isna()).all():
+                df[column] = narrowed
+        if len(df):
+            for column in df.select_dtypes("object"):
+                if df[column].nunique() / len(df) < category_ratio:
+                    df[column] = df[column].astype("category")
+        after = df.memory_usage(deep=True).sum()
+        _logger.info("Downcast DataFrame memory usage from %d to %d bytes", before, after)
+        return df
+
+    @staticmethod
+    def _freeze(df: Any) -> None:
+        """Mark the NumPy arrays backing df as read-only, in place."""
+        import numpy as np
+
+        for block in df._mgr.blocks:
+            if isinstance(block.values, np.ndarray):
+                block.values.flags.writeable = False
+
+    def as_arrow_batch(self) -> Any:
+        """Return ``self.df`` as a ``pyarrow.RecordBatch``.
+
+        Numeric columns without nulls are converted without copying.
+
+        Returns:
+            The DataFrame as a pyarrow RecordBatch, without the index.
+        """
+        import pyarrow as pa
+
+        return pa.RecordBatch.from_pandas(self.df, preserve_index=False)
+
+    @property
+    def batch_parameters(self) -> Mapping[str, Any]:
+        """Read-only view of the parameters passed to every batch request."""
+        return self._batch_parameters_view
+
+    @_wrap_errors("Failed to initialize Great Expectations context")
     def _initialize_context(self, mode: str = "file", project_root_dir: Optional[str] = None) -> object:
         """Initialize the Great Expectations context.
 
         Args:
             mode: The context mode to use.
-            project_root_dir: The root directory for the Great Expectations project.
+            project_root_dir: The root directory for the Great Expectations project,
+                already normalized with os.path.realpath.
 
         Returns:
             DataContext: Initialized Great Expectations context.
@@ -54,38 +385,176 @@ class SagenDataQuality:
         Raises:
             ValueError: If context initialization fails.
         """
-        try:
+        if project_root_dir is None:
+            project_root_dir = _DEFAULT_ROOT
+        key = (mode, project_root_dir)
+        # Double-checked locking: the common cache hit takes no lock.
+        context = _CONTEXT_CACHE.get(key)
+        if context is None:
+            with _CONTEXT_LOCK:
+                context = _CONTEXT_CACHE.get(key)
+                if context is None:
+                    if mode == "ephemeral":
+                        context = _get_gx().get_context(mode=mode)
+                    else:
+                        context = _get_gx().get_context(mode=mode, project_root_dir=project_root_dir)
+                    _CONTEXT_CACHE[key] = context
+        return context
+
+    @classmethod
+    def invalidate_context(cls, project_root_dir: Optional[str] = None) -> None:
+        """Drop cached contexts so the next instance re-reads the project config.
+
+        Args:
+            project_root_dir: Root directory whose contexts should be dropped.
+                If None, every cached context is dropped.
+        """
+        with _CONTEXT_LOCK, _PARTITION_LOCK:
             if project_root_dir is None:
-                project_root_dir = os.getcwd()
-            return gx.get_context(mode=mode, project_root_dir=project_root_dir)
-        except Exception as e:
-            raise ValueError(f"Failed to initialize Great Expectations context: {str(e)}")
+                _CONTEXT_CACHE.clear()
+                _PARTITION_REGISTRY.clear()
+                return
+            root = os.path.realpath(project_root_dir)
+            for key in [k for k in _CONTEXT_CACHE if k[1] == root]:
+                del _CONTEXT_CACHE[key]
+            for key in [k for k in _PARTITION_REGISTRY if k[1] == root]:
+                del _PARTITION_REGISTRY[key]
+
+    @classmethod
+    def set_default_project_root(cls, project_root_dir: str) -> None:
+        """Set the project root used by instances created without project_root_dir.
+
+        The default is the working directory at import time; it is not re-read
+        from os.getcwd() on each instantiation.
+
+        Args:
+            project_root_dir: The new default root directory.
+        """
+        global _DEFAULT_ROOT
+        _require(project_root_dir=project_root_dir)
+        _DEFAULT_ROOT = os.path.realpath(project_root_dir)
+
+    def _cached(self, cache: Dict[Any, Any], key: Any, load: Callable[[], Any]) -> Any:
+        """Return cache[key], calling load() to fill it on a miss.
+
+        Uses double-checked locking so cache hits stay lock-free while concurrent
+        misses (e.g. from run_checkpoints workers) load each entry only once. The
+        lock is re-entrant because loaders call other cached getters.
+        """
+        value = cache.get(key)
+        if value is None:
+            with self._cache_lock:
+                value = cache.get(key)
+                if value is None:
+                    value = load()
+                    cache[key] = value
+        return value
+
+    def invalidate_caches(self) -> None:
+        """Clear the cached data source, data asset, batch definition, suite and
+        validation definition lookups."""
+        self._ds_cache.clear()
+        self._asset_cache.clear()
+        self._bd_cache.clear()
+        self._suite_cache.clear()
+        self._vd_cache.clear()
     
 
+    @contextmanager
+    def bulk_register(self) -> Iterator[None]:
+        """Queue suite, validation definition and checkpoint registrations until exit.
+
+        Inside the block, create_expectation_suite, create_validation_definition and
+        create_checkpoint return their objects without writing to the stores, and
+        get_expectation_suite/get_validation_definition find queued objects first.
+        Expectations added to a queued suite are not saved separately. On a clean
+        exit every queued object is added to the context in creation order; if the
+        block raises, nothing is registered. Nested blocks join the outer one.
+
+        Example:
+            with dq.bulk_register():
+                suite = dq.create_expectation_suite("my_suite")
+                dq.add_expectations(expectations, suite=suite)
+                vd = dq.create_validation_definition("my_vd", suite, batch_definition)
+                dq.create_checkpoint("my_checkpoint", vd)
+
+        Raises:
+            ValueError: If registering a queued object fails.
+        """
+        if self._bulk_queue is not None:
+            yield
+            return
+
+        self._bulk_queue = []
+        try:
+            yield
+            queue = self._bulk_queue
+            self._bulk_queue = None
+            for collection, obj in queue:
+                try:
+                    self._add(collection, obj)
+                except Exception as e:
+                    raise ValueError(f"Failed to register '{obj.name}': {e}") from e
+        finally:
+            self._bulk_queue = None
+
+    def _register(self, collection: str, obj: Any) -> Any:
+        """Add obj to a context collection, or queue it inside bulk_register."""
+        if self._bulk_queue is not None:
+            self._bulk_queue.append((collection, obj))
+            return obj
+        return self._add(collection, obj)
+
+    def _add(self, collection: str, obj: Any) -> Any:
+        """Add obj to a context collection and cache suites and validation definitions.
+
+        Objects are only cached once they are really added, so a bulk_register
+        block that raises leaves no unregistered objects in the lookup caches.
+        """
+        obj = getattr(self.context, collection).add(obj)
+        cache = {"suites": self._suite_cache, "validation_definitions": self._vd_cache}.get(collection)
+        if cache is not None:
+            cache[obj.name] = obj
+        return obj
+
+    def _pending(self, collection: str, name: str) -> Any:
+        """Return the object queued under name in a collection, or None."""
+        if self._bulk_queue is None:
+            return None
+        for queued_collection, obj in reversed(self._bulk_queue):
+            if queued_collection == collection and obj.name == name:
+                return obj
+        return None
+
+    @_wrap_errors("Failed to create data source '{data_source_name}'")
     def set_data_source(self, data_source_name: str, data_frame_type: str = "pandas") -> object:
-        """Create and add a new data source to the context.
+        """Create and add a new data source to the context, or return the existing one.
 
         Args:
             data_source_name: Name of the data source to create.
             data_frame_type: Type of the DataFrame. Currently only "pandas" is supported.
 
         Returns:
-            The created data source object.
+            The existing or newly created data source object.
 
         Raises:
             ValueError: If data_source_name is empty or if data_frame_type is not supported.
         """
-        if not data_source_name:
-            raise ValueError("data_source_name cannot be empty")
+        _require(data_source_name=data_source_name)
         
         if data_frame_type != "pandas":
             raise ValueError("Only pandas DataFrame type is currently supported")
         
         try:
-            return self.context.data_sources.add_pandas(name=data_source_name)
-        except Exception as e:
-            raise ValueError(f"Failed to create data source '{data_source_name}': {str(e)}")
+            return self.get_data_source(data_source_name)
+        except ValueError:
+            pass
+
+        data_source = self.context.data_sources.add_pandas(name=data_source_name)
+        self.invalidate_caches()
+        return data_source
     
+    @_wrap_errors("Data source '{data_source_name}' not found")
     def get_data_source(self, data_source_name: str) -> object:
         """Retrieve an existing data source from the context.
 
@@ -98,16 +567,17 @@ class SagenDataQuality:
         Raises:
             ValueError: If data_source_name is empty or if the data source doesn't exist.
         """
-        if not data_source_name:
-            raise ValueError("data_source_name cannot be empty")
+        _require(data_source_name=data_source_name)
         
-        try:
-            return self.context.data_sources.get(data_source_name)
-        except Exception as e:
-            raise ValueError(f"Data source '{data_source_name}' not found: {str(e)}")
+        return self._cached(
+            self._ds_cache,
+            data_source_name,
+            lambda: self.context.data_sources.get(data_source_name)
+        )
 
+    @_wrap_errors("Failed to create data asset '{data_asset_name}'")
     def set_data_asset(self, data_source: object, data_asset_name: str, data_source_name: Optional[str] = None) -> object:
-        """Create and add a new data asset to a data source.
+        """Create and add a new data asset to a data source, or return the existing one.
 
         Args:
             data_source: The data source to add the asset to.
@@ -115,7 +585,7 @@ class SagenDataQuality:
             data_source_name: Optional Name of the data source. Defaults to None. 
 
         Returns:
-            The created data asset object.
+            The existing or newly created data asset object.
 
         Raises:
             ValueError: If data_source is None or data_asset_name is empty.
@@ -125,14 +595,22 @@ class SagenDataQuality:
                 data_source = self.get_data_source(data_source_name)
             else:
                 raise ValueError("Please provide either data_source object or data_source_name")
-        if not data_asset_name:
-            raise ValueError("data_asset_name cannot be empty")
+        _require(data_asset_name=data_asset_name)
         
         try:
-            return data_source.add_dataframe_asset(name=data_asset_name)
-        except Exception as e:
-            raise ValueError(f"Failed to create data asset '{data_asset_name}': {str(e)}")
+            return self.get_data_asset(
+                data_asset_name=data_asset_name,
+                data_source=data_source,
+                data_source_name=data_source_name
+            )
+        except ValueError:
+            pass
+
+        data_asset = data_source.add_dataframe_asset(name=data_asset_name)
+        self.invalidate_caches()
+        return data_asset
     
+    @_wrap_errors("Data asset '{data_asset_name}' not found")
     def get_data_asset(self,  data_asset_name: str, data_source: object = None,data_source_name: Optional[str] = None) -> object:
         """Retrieve an existing data asset from a data source.
 
@@ -154,18 +632,23 @@ class SagenDataQuality:
                 data_source = self.get_data_source(data_source_name)
             else:
                 raise ValueError("Please provide either data_source object or data_source_name")
-        if not data_asset_name:
-            raise ValueError("data_asset_name cannot be empty")
-        
-        try:
+        _require(data_asset_name=data_asset_name)
+
+        source_name = data_source_name or getattr(data_source, "name", None)
+        if source_name is None:
             return data_source.get_asset(data_asset_name)
-        except Exception as e:
-            raise ValueError(f"Data asset '{data_asset_name}' not found: {str(e)}")
+        return self._cached(
+            self._asset_cache,
+            (source_name, data_asset_name),
+            lambda: data_source.get_asset(data_asset_name)
+        )
     
 
+    @_wrap_errors("Failed to create batch definition '{batch_definition_name}'")
     def set_batch_definition(self,  batch_definition_name: str, data_asset: object = None ,data_asset_name: Optional[str] = None,data_source_name: Optional[str] = None) -> object:
         """Create a new batch definition for a data asset. You need to provide batch definition name and 
         data asset object or data asset name and data source name so that it can automatically get data asset object.
+        If the asset already has a batch definition with this name, it is returned instead.
 
         Args:
             data_asset: The data asset to create the batch definition for.
@@ -174,7 +657,7 @@ class SagenDataQuality:
             data_source_name: Optional Name of the data source. Defaults to None.
 
         Returns:
-            The created batch definition object.
+            The existing or newly created batch definition object.
 
         Raises:
             ValueError: If data_asset is None or batch_definition_name is empty.
@@ -184,14 +667,128 @@ class SagenDataQuality:
                 data_asset = self.get_data_asset(data_asset_name=data_asset_name,data_source_name=data_source_name)
             else:
                 raise ValueError("Please provide either data_asset object or data_asset_name and data_source_name")
-        if not batch_definition_name:
-            raise ValueError("batch_definition_name cannot be empty")
+        _require(batch_definition_name=batch_definition_name)
         
         try:
-            return data_asset.add_batch_definition_whole_dataframe(name=batch_definition_name)
-        except Exception as e:
-            raise ValueError(f"Failed to create batch definition '{batch_definition_name}': {str(e)}")
+            return data_asset.get_batch_definition(batch_definition_name)
+        except Exception:
+            pass
+
+        batch_definition = data_asset.add_batch_definition_whole_dataframe(name=batch_definition_name)
+        self.invalidate_caches()
+        return batch_definition
     
+    @_wrap_errors("Failed to create partitioned batch definition '{batch_definition_name}'")
+    def set_partitioned_batch_definition(
+        self,
+        batch_definition_name: str,
+        data_asset: object = None,
+        data_asset_name: Optional[str] = None,
+        data_source_name: Optional[str] = None,
+        partition_col: Optional[str] = None,
+        n_splits: Optional[int] = None
+    ) -> List[object]:
+        """Create one batch definition per partition of ``self.df``.
+
+        DataFrame assets only support whole-dataframe batch definitions, so each
+        partition is registered as ``"{batch_definition_name}_part_{i}"`` and its
+        rows are remembered. get_data_batch, run_validation, run_validation_parallel,
+        run_checkpoint and run_checkpoint_summary then use only the matching rows
+        for these definitions, unless explicit batch parameters are passed.
+        Partitions follow the distinct values of ``partition_col`` (calendar months
+        for datetime columns), with rows where it is null forming the last
+        partition, or ``n_splits`` contiguous row ranges when no column is given.
+
+        The rows are only known to this instance and are forgotten when ``df`` is
+        reassigned, but the definitions stay registered in the context. Getting
+        or running them without known rows raises ValueError rather than
+        validating the whole frame; call this method again to rebuild the rows.
+
+        Args:
+            batch_definition_name: Prefix for the batch definition names.
+            data_asset: The data asset to create the batch definitions for.
+            data_asset_name: Optional Name of the data asset. Defaults to None.
+            data_source_name: Optional Name of the data source. Defaults to None.
+            partition_col: Optional column to partition by.
+            n_splits: Number of row ranges when partition_col is None.
+
+        Returns:
+            The batch definitions, in partition order.
+
+        Raises:
+            ValueError: If neither partition_col nor a positive n_splits is given,
+                      or if creation fails.
+        """
+        import numpy as np
+
+        _require(batch_definition_name=batch_definition_name)
+        if partition_col is None and (n_splits is None or n_splits <= 0):
+            raise ValueError("Provide either 'partition_col' or a positive 'n_splits'")
+
+        if partition_col is not None:
+            column = self.df[partition_col]
+            if column.dtype.kind == "M":
+                column = column.dt.to_period("M")
+            # ngroup rather than .indices: the latter drops the null group of
+            # categorical columns even with dropna=False.
+            codes = self.df.groupby(column, sort=True, observed=True, dropna=False).ngroup().to_numpy()
+            order = np.argsort(codes, kind="stable")
+            boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+            partitions = [rows for rows in np.split(order, boundaries) if len(rows)]
+        else:
+            partitions = [rows for rows in np.array_split(np.arange(len(self.df)), n_splits) if len(rows)]
+
+        batch_definitions = []
+        for i, rows in enumerate(partitions):
+            batch_definition = self.set_batch_definition(
+                batch_definition_name=f"{batch_definition_name}_part_{i}",
+                data_asset=data_asset,
+                data_asset_name=data_asset_name,
+                data_source_name=data_source_name
+            )
+            self._partitions[self._batch_definition_key(batch_definition)] = rows
+            batch_definitions.append(batch_definition)
+        self._register_partitions(batch_definitions)
+        return batch_definitions
+
+    def _partitions_path(self) -> Optional[str]:
+        """Return the file listing partitioned batch definitions, or None in ephemeral mode."""
+        root_directory = getattr(self.context, "root_directory", None)
+        if self.mode == "ephemeral" or not root_directory:
+            return None
+        return os.path.join(root_directory, "uncommitted", _PARTITIONS_FILE)
+
+    def _partition_registry(self) -> Set[Tuple[str, str, str]]:
+        """Return the partitioned batch definitions of this instance's context.
+
+        Must be called with _PARTITION_LOCK held.
+        """
+        key = (self.mode, self.project_root_dir)
+        registry = _PARTITION_REGISTRY.get(key)
+        if registry is None:
+            registry = set()
+            path = self._partitions_path()
+            if path is not None and os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    registry = {tuple(names) for names in json.load(f)}
+            _PARTITION_REGISTRY[key] = registry
+        return registry
+
+    def _register_partitions(self, batch_definitions: List[Any]) -> None:
+        """Record batch definitions as partitions, in memory and, in file mode, on disk."""
+        with _PARTITION_LOCK:
+            registry = self._partition_registry()
+            registry.update(self._batch_definition_key(bd) for bd in batch_definitions)
+            path = self._partitions_path()
+            if path is None:
+                return
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(sorted(registry), f)
+            os.replace(temp_path, path)
+
+    @_wrap_errors("Failed to retrieve batch definition '{batch_definition_name}'")
     def get_batch_definition(
         self, 
         batch_definition_name: str,
@@ -217,31 +814,83 @@ class SagenDataQuality:
             ValueError: If neither data_asset nor (data_source_name, data_asset_name) are provided,
                       or if the batch definition cannot be found.
         """
-        if not batch_definition_name:
-            raise ValueError("batch_definition_name cannot be empty")
+        _require(batch_definition_name=batch_definition_name)
+
+        if data_asset is not None:
+            return data_asset.get_batch_definition(batch_definition_name)
+
+        if data_source_name and data_asset_name:
+            return self._cached(
+                self._bd_cache,
+                (data_source_name, data_asset_name, batch_definition_name),
+                lambda: self.get_data_asset(
+                    data_asset_name=data_asset_name, data_source_name=data_source_name
+                ).get_batch_definition(batch_definition_name)
+            )
 
-        try:
-            if data_asset is not None:
-                return data_asset.get_batch_definition(batch_definition_name)
+        raise ValueError(
+            "You must provide either a 'data_asset' object or both 'data_source_name' "
+            "and 'data_asset_name'."
+        )
+    
 
-            if data_source_name and data_asset_name:
-                data_source = self.get_data_source(data_source_name)
-                data_asset = self.get_data_asset(data_asset_name=data_asset_name, data_source_name=data_source_name)
-                return data_asset.get_batch_definition(batch_definition_name)
+    @staticmethod
+    def _batch_definition_key(batch_definition: "BatchDefinition") -> Tuple[str, str, str]:
+        """Identify a batch definition by data source, data asset and name.
+
+        Names are only unique within an asset, so the name alone is not enough.
+        """
+        data_asset = batch_definition.data_asset
+        return (data_asset.datasource.name, data_asset.name, batch_definition.name)
+
+    def _batch_parameters_for(self, batch_definition: "BatchDefinition") -> Dict[str, Any]:
+        """Return batch parameters selecting batch_definition's rows of ``self.df``.
+
+        Definitions from set_partitioned_batch_definition get their partition's rows;
+        every other definition gets the whole frame.
 
+        Raises:
+            ValueError: If batch_definition is a partition whose rows this instance
+                does not know, because ``df`` was reassigned or the partitions were
+                created by another instance or process.
+        """
+        key = self._batch_definition_key(batch_definition)
+        rows = self._partitions.get(key)
+        if rows is not None:
+            return {"dataframe": self.df.iloc[rows]}
+        with _PARTITION_LOCK:
+            partitioned = key in self._partition_registry()
+        if partitioned:
             raise ValueError(
-                "You must provide either a 'data_asset' object or both 'data_source_name' "
-                "and 'data_asset_name'."
+                f"Batch definition '{batch_definition.name}' is a partition from "
+                "set_partitioned_batch_definition, but its rows are unknown for the "
+                "current df; call set_partitioned_batch_definition again"
             )
-        except Exception as e:
+        return self._batch_parameters
+
+    def _checkpoint_batch_parameters(self, checkpoint: Any) -> Dict[str, Any]:
+        """Return batch parameters for running every validation definition of checkpoint.
+
+        Raises:
+            ValueError: If the validation definitions need different partitions,
+                since a checkpoint run passes the same parameters to all of them.
+        """
+        batch_definitions = {
+            self._batch_definition_key(vd.batch_definition): vd.batch_definition
+            for vd in checkpoint.validation_definitions
+        }
+        parameters = [self._batch_parameters_for(bd) for bd in batch_definitions.values()]
+        if len(parameters) > 1 and any(p is not self._batch_parameters for p in parameters):
             raise ValueError(
-                f"Failed to retrieve batch definition '{batch_definition_name}': {str(e)}"
+                f"Checkpoint '{checkpoint.name}' mixes batch definitions from "
+                "set_partitioned_batch_definition; run its validation definitions separately"
             )
-    
+        return parameters[0]
 
+    @_wrap_errors("Failed to retrieve batch")
     def get_data_batch(
         self,
-        batch_definition: Optional[BatchDefinition] = None,
+        batch_definition: Optional["BatchDefinition"] = None,
         batch_definition_name: Optional[str] = None,
         data_source_name: Optional[str] = None,
         data_asset_name: Optional[str] = None,
@@ -260,56 +909,64 @@ class SagenDataQuality:
             data_asset: Optional data asset object.
 
         Returns:
-            A batch object containing the requested data.
+            A batch object containing the requested data, or only the partition's
+            rows for definitions from set_partitioned_batch_definition. The batch
+            is cached per batch definition until ``df`` is reassigned.
 
         Raises:
             ValueError: If neither batch_definition nor the combination of names
                       (batch_definition_name, data_source_name, data_asset_name)
                       is provided, or if the batch cannot be retrieved.
         """
-        try:
-            if batch_definition is not None:
-                return batch_definition.get_batch(batch_parameters=self.batch_parameters)
-            
-            if all([batch_definition_name, data_source_name, data_asset_name]):
-                batch_definition = self.get_batch_definition(
-                    batch_definition_name=batch_definition_name,
-                    data_source_name=data_source_name,
-                    data_asset_name=data_asset_name
+        if batch_definition is None:
+            if (
+                batch_definition_name is None
+                or data_source_name is None
+                or data_asset_name is None
+            ):
+                raise ValueError(
+                    "You must provide either a 'batch_definition' or the combination of "
+                    "'batch_definition_name', 'data_source_name', and 'data_asset_name'."
                 )
-                return batch_definition.get_batch(batch_parameters=self.batch_parameters)
-            
-            raise ValueError(
-                "You must provide either a 'batch_definition' or the combination of "
-                "'batch_definition_name', 'data_source_name', and 'data_asset_name'."
+            batch_definition = self.get_batch_definition(
+                batch_definition_name=batch_definition_name,
+                data_source_name=data_source_name,
+                data_asset_name=data_asset_name
             )
-        except Exception as e:
-            raise ValueError(f"Failed to retrieve batch: {str(e)}")
+
+        # Batches are reused while self.df is unchanged; assigning a new df clears this.
+        key = self._batch_definition_key(batch_definition)
+
+        def load_batch() -> Any:
+            return batch_definition.get_batch(batch_parameters=self._batch_parameters_for(batch_definition))
+
+        return self._cached(self._batch_cache, (id(self.df), key), load_batch)
     
 
-    def create_expectation_suite(self, suite_name: str) -> ExpectationSuite:
-        """Create a new expectation suite.
+    @_wrap_errors("Failed to create expectation suite '{suite_name}'")
+    def create_expectation_suite(self, suite_name: str) -> "ExpectationSuite":
+        """Create a new expectation suite, or return the existing one with this name.
 
         Args:
             suite_name: Name of the expectation suite to create.
 
         Returns:
-            The created expectation suite object.
+            The existing or newly created expectation suite object.
 
         Raises:
             ValueError: If suite_name is empty or if creation fails.
         """
-        if not suite_name:
-            raise ValueError("suite_name cannot be empty")
-        
+        _require(suite_name=suite_name)
+
         try:
-            suite = gx.ExpectationSuite(name=suite_name)
-            self.context.suites.add(suite)
-            return suite
-        except Exception as e:
-            raise ValueError(f"Failed to create expectation suite '{suite_name}': {str(e)}")
+            return self.get_expectation_suite(suite_name)
+        except ValueError:
+            pass
+        
+        return self._register("suites", _get_gx().ExpectationSuite(name=suite_name))
 
-    def get_expectation_suite(self, suite_name: str) -> ExpectationSuite:
+    @_wrap_errors("Failed to retrieve expectation suite '{suite_name}'")
+    def get_expectation_suite(self, suite_name: str) -> "ExpectationSuite":
         """Retrieve an existing expectation suite.
 
         Args:
@@ -321,22 +978,32 @@ class SagenDataQuality:
         Raises:
             ValueError: If suite_name is empty or if the suite doesn't exist.
         """
-        if not suite_name:
-            raise ValueError("suite_name cannot be empty")
+        _require(suite_name=suite_name)
         
-        try:
-            return self.context.suites.get(suite_name)
-        except Exception as e:
-            raise ValueError(f"Failed to retrieve expectation suite '{suite_name}': {str(e)}")
+        pending = self._pending("suites", suite_name)
+        if pending is not None:
+            return pending
+        return self._cached(
+            self._suite_cache,
+            suite_name,
+            lambda: self.context.suites.get(suite_name)
+        )
     
     def add_expectation(
         self,
         expectation: Any,
-        suite: Optional[ExpectationSuite] = None,
+        suite: Optional["ExpectationSuite"] = None,
         suite_name: Optional[str] = None
-    ) -> ExpectationSuite:
+    ) -> "ExpectationSuite":
         """Add an expectation to a suite.
 
+        The expectation is only added in memory: nothing is written to the store
+        until flush(), which saves each dirty suite once and is called by
+        create_validation_definition, create_checkpoint and the run_* methods.
+        Call flush() before using the suite through the context directly, and
+        before exiting a setup script that runs none of these, since the stored
+        copy is stale until then.
+
         Args:
             expectation: The expectation to add.
             suite: Optional expectation suite object.
@@ -351,28 +1018,144 @@ class SagenDataQuality:
         """
         if expectation is None:
             raise ValueError("expectation cannot be None")
-        if suite is None and not suite_name:
+        return self.add_expectations(
+            [expectation], suite=suite, suite_name=suite_name, defer_save=True
+        )
+
+    @_wrap_errors("Failed to add expectation")
+    def add_expectations(
+        self,
+        expectations: List[Any],
+        suite: Optional["ExpectationSuite"] = None,
+        suite_name: Optional[str] = None,
+        defer_save: bool = False
+    ) -> "ExpectationSuite":
+        """Add several expectations to a suite and save it once.
+
+        Adding N expectations this way costs one store write, where calling
+        ``ExpectationSuite.add_expectation`` N times on a saved suite costs N.
+        Expectations equal to one already in the suite are skipped. Nothing is
+        saved when expectations is empty.
+
+        Args:
+            expectations: The expectations to add.
+            suite: Optional expectation suite object.
+            suite_name: Optional name of the expectation suite.
+            defer_save: If True, mark the suite dirty instead of saving it; it is
+                saved by the next flush(). Defaults to False.
+
+        Returns:
+            The updated expectation suite object.
+
+        Raises:
+            ValueError: If expectations contains None, if neither suite nor
+                      suite_name is provided, or if the expectations cannot be added.
+        """
+        if any(expectation is None for expectation in expectations):
+            raise ValueError("expectation cannot be None")
+        if suite is None and suite_name is None:
             raise ValueError("Either 'suite' or 'suite_name' must be provided")
 
-        try:
-            target_suite = suite if suite is not None else self.get_expectation_suite(suite_name)
-            target_suite.add_expectation(expectation)
-            target_suite.save()
+        if suite is not None:
+            target_suite = suite
+        else:
+            # Reuse a dirty suite so unsaved expectations are not lost to a fresh load.
+            target_suite = self._dirty_suites.get(suite_name) or self.get_expectation_suite(suite_name)
+        if not expectations:
             return target_suite
-        except Exception as e:
-            raise ValueError(f"Failed to add expectation: {str(e)}")
-    
-    
+        self._append_expectations(target_suite, expectations)
+        if defer_save:
+            self._dirty_suites[target_suite.name] = target_suite
+        elif self._pending("suites", target_suite.name) is target_suite:
+            # Registered with all its expectations when bulk_register exits.
+            pass
+        else:
+            target_suite.save()
+            self._dirty_suites.pop(target_suite.name, None)
+        return target_suite
+
+    @staticmethod
+    def _append_expectations(suite: "ExpectationSuite", expectations: List[Any]) -> None:
+        """Add expectations to suite in memory, without writing it to the store.
+
+        Mirrors ``ExpectationSuite.add_expectation``, which writes the whole suite
+        to the store for every expectation once the suite has been saved. The
+        caller saves the suite afterwards; that save assigns the new ids.
+        """
+        for expectation in expectations:
+            if expectation.id:
+                raise ValueError(
+                    "Expectation already belongs to an ExpectationSuite; add copy.copy(expectation) instead"
+                )
+            # Suites are set-like: skip expectations equal to one already present.
+            if any(suite._expectations_are_equalish(expectation, existing) for existing in suite.expectations):
+                continue
+            suite.expectations.append(expectation)
+            expectation.register_save_callback(save_callback=suite._save_expectation)
+
+    @_wrap_errors("Failed to save expectation suites")
+    def flush(self) -> None:
+        """Save every suite with expectations added by add_expectation since the last flush.
+
+        Each dirty suite is written once, however many expectations it received.
+        Suites still queued in bulk_register are left for its exit to register.
+
+        Raises:
+            ValueError: If saving a suite fails.
+        """
+        dirty, self._dirty_suites = self._dirty_suites, {}
+        for suite in dirty.values():
+            if self._pending("suites", suite.name) is not suite:
+                suite.save()
+
+    @contextmanager
+    def batch_expectations(
+        self,
+        suite: Optional["ExpectationSuite"] = None,
+        suite_name: Optional[str] = None
+    ) -> Iterator["_ExpectationBatch"]:
+        """Collect expectations inside a ``with`` block and save the suite once on exit.
+
+        Example:
+            with dq.batch_expectations(suite_name="my_suite") as batch:
+                batch.add(expectation_1)
+                batch.add(expectation_2)
+
+        Args:
+            suite: Optional expectation suite object.
+            suite_name: Optional name of the expectation suite.
+
+        Yields:
+            A collector whose add method queues an expectation.
+
+        Raises:
+            ValueError: If neither suite nor suite_name is provided,
+                      or if the expectations cannot be added.
+        """
+        if suite is None and suite_name is None:
+            raise ValueError("Either 'suite' or 'suite_name' must be provided")
+
+        batch = _ExpectationBatch()
+        yield batch
+        if batch.expectations:
+            self.add_expectations(batch.expectations, suite=suite, suite_name=suite_name)
+
+    @_wrap_errors("Failed to create validation definition '{validation_definition_name}'")
     def create_validation_definition(
         self,
         validation_definition_name: str,
-        suite: ExpectationSuite,
-        batch_definition: Optional[BatchDefinition] = None,
+        suite: "ExpectationSuite",
+        batch_definition: Optional["BatchDefinition"] = None,
         data_source_name: Optional[str] = None,
         data_asset_name: Optional[str] = None,
-        data_asset: Optional[object] = None
+        data_asset: Optional[object] = None,
+        batch_definition_name: Optional[str] = None
     ) -> Any:
-        """Create a new validation definition.
+        """Create a new validation definition, or return the existing one with this name.
+
+        Without a batch_definition, the batch definition is looked up on the data
+        asset by batch_definition_name, or is the asset's only batch definition
+        when no name is given.
 
         Args:
             validation_definition_name: Name of the validation definition.
@@ -381,46 +1164,55 @@ class SagenDataQuality:
             data_source_name: Optional name of the data source.
             data_asset_name: Optional name of the data asset.
             data_asset: Optional data asset object.
+            batch_definition_name: Optional name of the asset's batch definition
+                to use when batch_definition is not given.
 
         Returns:
-            The created validation definition object.
+            The existing or newly created validation definition object.
 
         Raises:
             ValueError: If required parameters are missing or if creation fails.
         """
-        if not validation_definition_name:
-            raise ValueError("validation_definition_name cannot be empty")
+        _require(validation_definition_name=validation_definition_name)
         if suite is None:
             raise ValueError("suite cannot be None")
 
+        # GX refuses to register a validation definition whose suite has unsaved changes.
+        self.flush()
         try:
-            if batch_definition is None:
-                if data_asset is not None:
-                    batch_definition = data_asset.get_batch_definition()
-                elif data_source_name and data_asset_name:
-                    data_source = self.get_data_source(data_source_name)
-                    data_asset = self.get_data_asset(data_source, data_asset_name)
-                    batch_definition = data_asset.get_batch_definition()
-                else:
+            return self.get_validation_definition(validation_definition_name)
+        except ValueError:
+            pass
+
+        if batch_definition is None:
+            if data_asset is None:
+                if data_source_name is None or data_asset_name is None:
                     raise ValueError(
                         "You must provide either a 'batch_definition', a 'data_asset', "
                         "or both 'data_source_name' and 'data_asset_name'."
                     )
+                data_asset = self.get_data_asset(
+                    data_asset_name=data_asset_name,
+                    data_source_name=data_source_name
+                )
+            if batch_definition_name:
+                batch_definition = data_asset.get_batch_definition(batch_definition_name)
+            elif len(data_asset.batch_definitions) == 1:
+                batch_definition = data_asset.batch_definitions[0]
             else:
-                validation_definition_name = gx.ValidationDefinition(
-                    data = batch_definition,
-                    suite = suite,
-                    name = validation_definition_name
+                raise ValueError(
+                    f"Data asset '{data_asset.name}' has {len(data_asset.batch_definitions)} "
+                    "batch definitions; provide 'batch_definition' or 'batch_definition_name'."
                 )
 
-            return self.context.validation_definitions.add(
-                validation_definition_name
-            )
-        except Exception as e:
-            raise ValueError(
-                f"Failed to create validation definition '{validation_definition_name}': {str(e)}"
-            )
+        vd = _get_gx().ValidationDefinition(
+            data=batch_definition,
+            suite=suite,
+            name=validation_definition_name
+        )
+        return self._register("validation_definitions", vd)
 
+    @_wrap_errors("Failed to run validation")
     def run_validation(self, validation_definition_name: str) -> Any:
         """Run a validation using the specified validation definition.
 
@@ -433,17 +1225,88 @@ class SagenDataQuality:
         Raises:
             ValueError: If validation_definition_name is empty or if validation fails.
         """
-        if not validation_definition_name:
-            raise ValueError("validation_definition_name cannot be empty")
+        _require(validation_definition_name=validation_definition_name)
         
-        try:
-            validation_definition = self.context.validation_definitions.get(
-                name=validation_definition_name
-            )
-            return validation_definition.run(batch_parameters=self.batch_parameters)
-        except Exception as e:
-            raise ValueError(f"Failed to run validation: {str(e)}")
+        self.flush()
+        validation_definition = self.get_validation_definition(validation_definition_name)
+        return validation_definition.run(
+            batch_parameters=self._batch_parameters_for(validation_definition.batch_definition)
+        )
+
+    @_wrap_errors("Failed to run validation")
+    def run_validation_parallel(
+        self,
+        validation_definition_name: str,
+        max_workers: int = 4
+    ) -> Any:
+        """Run a validation with its expectations split by column across threads.
+
+        Expectations are grouped by their ``column`` argument and each group is
+        validated as a transient suite against one shared batch in a thread pool.
+        Multi-column and table-level expectations form a single group that runs
+        serially. Data Docs and stores are not updated.
+
+        Args:
+            validation_definition_name: Name of the validation definition to run.
+            max_workers: Maximum number of worker threads. Defaults to 4.
+
+        Returns:
+            An ExpectationSuiteValidationResult merging all groups: success is True
+            only if every group succeeded and results are concatenated.
 
+        Raises:
+            ValueError: If validation_definition_name is empty or if validation fails.
+        """
+        _require(validation_definition_name=validation_definition_name)
+
+        from great_expectations.core.expectation_validation_result import (
+            ExpectationSuiteValidationResult,
+        )
+
+        gx = _get_gx()
+        self.flush()
+        validation_definition = self.get_validation_definition(validation_definition_name)
+        suite = validation_definition.suite
+        batch_definition = validation_definition.batch_definition
+
+        groups: Dict[Optional[str], List[Any]] = {}
+        for expectation in suite.expectations:
+            column = expectation.configuration.kwargs.get("column")
+            groups.setdefault(column, []).append(expectation)
+
+        # Every group validates the same rows. Batch.validate loads the batch into
+        # the datasource's single cached execution engine, so the threads share
+        # that engine and its batch manager; since each of them registers a batch
+        # of identical data, whichever batch is active yields the same metrics.
+        batch = batch_definition.get_batch(batch_parameters=self._batch_parameters_for(batch_definition))
+
+        def validate_group(item: Tuple[Optional[str], List[Any]]) -> Any:
+            column, expectations = item
+            # copy.copy drops the expectation's id, which ties it to the stored suite.
+            group_suite = gx.ExpectationSuite(
+                name=f"{suite.name}__{column or 'table'}",
+                expectations=[copy.copy(expectation) for expectation in expectations],
+            )
+            return batch.validate(group_suite)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            group_results = list(executor.map(validate_group, groups.items()))
+
+        results = [result for group in group_results for result in group.results]
+        successful = sum(1 for result in results if result.success)
+        return ExpectationSuiteValidationResult(
+            success=all(group.success for group in group_results),
+            results=results,
+            suite_name=suite.name,
+            statistics={
+                "evaluated_expectations": len(results),
+                "successful_expectations": successful,
+                "unsuccessful_expectations": len(results) - successful,
+                "success_percent": 100.0 * successful / len(results) if results else None,
+            },
+        )
+
+    @_wrap_errors("Failed to retrieve validation definition '{validation_definition_name}'")
     def get_validation_definition(self, validation_definition_name: str) -> Any:
         """Retrieve an existing validation definition.
 
@@ -456,139 +1319,590 @@ class SagenDataQuality:
         Raises:
             ValueError: If validation_definition_name is empty or if retrieval fails.
         """
-        if not validation_definition_name:
-            raise ValueError("validation_definition_name cannot be empty")
+        _require(validation_definition_name=validation_definition_name)
         
-        try:
-            return self.context.validation_definitions.get(name=validation_definition_name)
-        except Exception as e:
-            raise ValueError(
-                f"Failed to retrieve validation definition '{validation_definition_name}': {str(e)}"
-            )
+        pending = self._pending("validation_definitions", validation_definition_name)
+        if pending is not None:
+            return pending
+        return self._cached(
+            self._vd_cache,
+            validation_definition_name,
+            lambda: self.context.validation_definitions.get(name=validation_definition_name)
+        )
     
+    @_wrap_errors("Failed to create action list '{action_list_name}'")
     def create_action_list(
         self,
         action_list_name: str,
-        actions: Optional[List[Any]] = None
+        actions: Optional[List[Any]] = None,
+        site_name: Optional[str] = None
     ) -> Any:
         """Create a new action list.
 
         Args:
             action_list_name: Name of the action list to create.
             actions: Optional list of actions. If None, a default UpdateDataDocsAction
-                    will be created.
+                    will be created, or no actions at all in an ephemeral context,
+                    which has no Data Docs sites.
+            site_name: Optional Data Docs site updated by the default action. If None,
+                    the site is looked up in the instance's site map, falling back
+                    to its default site.
 
         Returns:
-            The created action list object.
+            The action list. Lists are cached per name, so creating the default
+            list again for the same name returns the earlier actions.
 
         Raises:
             ValueError: If action_list_name is empty or if creation fails.
         """
-        if not action_list_name:
-            raise ValueError("action_list_name cannot be empty")
-
-        try:
-            if actions is None:
-                if action_list_name == "delq_history_checkpoint_dev_actions":
-                    actions = [
-                        UpdateDataDocsAction(name=f"Update Data Docs for {action_list_name}", site_names=["local_site1"])
-                    ]
-                else:
-                    actions = [
-                        UpdateDataDocsAction(name=f"Update Data Docs for {action_list_name}", site_names=["local_site2"])
-                    ]
-
-            action_list = actions
-            return action_list
-        except Exception as e:
-            raise ValueError(f"Failed to create action list '{action_list_name}': {str(e)}")
-
+        _require(action_list_name=action_list_name)
+
+        if actions is not None:
+            self._action_list_cache[action_list_name] = list(actions)
+            return actions
+
+        cached = self._action_list_cache.get(action_list_name)
+        if cached is not None and site_name is None:
+            return list(cached)
+
+        if self.mode == "ephemeral":
+            actions = []
+        else:
+            if site_name is None:
+                site_name = self._site_map.get(action_list_name, self._default_site)
+            actions = list(_default_actions(site_name))
+        self._action_list_cache[action_list_name] = actions
+        return list(actions)
+
+    @_wrap_errors("Failed to create checkpoint '{checkpoint_name}'")
     def create_checkpoint(
         self,
         checkpoint_name: str,
         validation_definition: Any,
         action_list: Optional[Any] = None,
-        result_format: str = "COMPLETE"
+        result_format: str = "SUMMARY",
+        site_name: Optional[str] = None,
+        render_docs: bool = True
     ) -> Any:
-        """Create a new checkpoint.
+        """Create a new checkpoint, or return the existing one with this name.
 
         Args:
             checkpoint_name: Name of the checkpoint to create.
             validation_definition: The validation definition to use.
             action_list: Optional action list object.
-            result_format: Format for validation results. Defaults to "COMPLETE".
+            result_format: Format for validation results. Defaults to "SUMMARY", which
+                reports counts and a sample of unexpected values. "COMPLETE" also
+                lists every unexpected value and index, which can be megabytes of
+                JSON on large frames; opt into it only when that detail is needed.
+            site_name: Optional Data Docs site for the default action list.
+            render_docs: If False and no action_list is given, the checkpoint is created
+                without actions so runs do not re-render Data Docs. Defaults to True.
 
         Returns:
-            The created checkpoint object.
+            The existing or newly created checkpoint object.
 
         Raises:
             ValueError: If required parameters are missing or if creation fails.
         """
-        if not checkpoint_name:
-            raise ValueError("checkpoint_name cannot be empty")
+        _require(checkpoint_name=checkpoint_name)
         if validation_definition is None:
             raise ValueError("validation_definition cannot be None")
 
+        # GX refuses to register a checkpoint whose suites have unsaved changes.
+        self.flush()
+        existing = self._pending("checkpoints", checkpoint_name)
+        if existing is not None:
+            return existing
         try:
-            if action_list is None:
-                action_list = self.create_action_list(
-                    action_list_name=f"{checkpoint_name}_actions"
-                )
-
-            checkpoint = gx.Checkpoint(
-                name=checkpoint_name,
-                validation_definitions=[validation_definition],
-                actions=action_list,
-                result_format={"result_format": result_format}
+            return self.context.checkpoints.get(checkpoint_name)
+        except Exception:
+            pass
+
+        if action_list is None and not render_docs:
+            action_list = []
+        if action_list is None:
+            action_list = self.create_action_list(
+                action_list_name=f"{checkpoint_name}_actions",
+                site_name=site_name
             )
-            self.context.checkpoints.add(checkpoint)
-            return checkpoint
-        except Exception as e:
-            raise ValueError(f"Failed to create checkpoint '{checkpoint_name}': {str(e)}")
 
+        checkpoint = _get_gx().Checkpoint(
+            name=checkpoint_name,
+            validation_definitions=[validation_definition],
+            actions=action_list,
+            result_format={"result_format": result_format}
+        )
+        self._register("checkpoints", checkpoint)
+        return checkpoint
+
+    @_wrap_errors("Failed to run checkpoint '{checkpoint_name}'")
     def run_checkpoint(
         self,
         checkpoint_name: str,
-        run_id: Optional[str] = None
+        run_id: Optional[str] = None,
+        batch_parameters: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
+        render_docs: bool = True,
+        defer_docs: bool = False
     ) -> Any:
         """Run a checkpoint.
 
         Args:
             checkpoint_name: Name of the checkpoint to run.
             run_id: Optional identifier for the run. If None, a default one will be created.
+            batch_parameters: Optional batch parameters overriding ``self.batch_parameters``
+                (or the partition's rows, for partitioned batch definitions) for this
+                run only.
+            use_cache: If True, return the previous result when the DataFrame contents
+                and the checkpoint/suite configuration are unchanged. Results are kept
+                in memory and written as JSON under ``~/.sagen_dq_cache`` for reuse
+                across processes; results read back from disk keep their ``meta``
+                as plain JSON values. A cache hit does not run the checkpoint actions.
+            render_docs: If False, the checkpoint's actions (such as Data Docs
+                rendering) are skipped for this run by running its validation
+                definitions directly. Defaults to True.
+            defer_docs: If True, actions are skipped and the validation result
+                identifiers are kept until finalize_docs() renders them in one pass.
+                Defaults to False.
 
         Returns:
-            The results of the checkpoint run.
+            The results of the checkpoint run. Success is not inspected here; check
+            ``results.success`` if needed.
 
         Raises:
             ValueError: If checkpoint_name is empty or if the run fails.
         """
-        if not checkpoint_name:
-            raise ValueError("checkpoint_name cannot be empty")
+        _require(checkpoint_name=checkpoint_name)
 
-        try:
-            run_identifier = RunIdentifier(
-                run_name=run_id if run_id else f"run_{checkpoint_name}"
-            )
+        self.flush()
+        from great_expectations.core import RunIdentifier
+
+        run_identifier = RunIdentifier(
+            run_name=run_id if run_id else f"run_{checkpoint_name}"
+        )
+
+        checkpoint = self.context.checkpoints.get(checkpoint_name)
+        if batch_parameters is None:
+            batch_parameters = self._checkpoint_batch_parameters(checkpoint)
+
+        cache_key = None
+        if use_cache:
+            cache_key = self._result_cache_key(checkpoint, batch_parameters["dataframe"])
+            results = self._load_cached_result(cache_key, checkpoint)
+            if results is not None:
+                _logger.info("Checkpoint %s result cache hit (%s)", checkpoint_name, cache_key)
+                return results
+            _logger.info("Checkpoint %s result cache miss (%s)", checkpoint_name, cache_key)
 
-            checkpoint = self.context.checkpoints.get(checkpoint_name)
+        if render_docs and not defer_docs:
             results = checkpoint.run(
                 run_id=run_identifier,
-                batch_parameters=self.batch_parameters,
-                
+                batch_parameters=batch_parameters,
             )
-            
-            # Log the result but avoid print statements
-            if not results.success:
-                print(f"Checkpoint '{checkpoint_name}' validation failed")
+        else:
+            results = self._run_validation_definitions(
+                checkpoint, batch_parameters, run_identifier, checkpoint.result_format
+            )
+        if defer_docs:
+            self._pending_docs.extend(results.run_results.keys())
+        if cache_key is not None:
+            self._store_cached_result(cache_key, results)
+
+        # results.success is only read when debug logging is on; callers check it themselves.
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Checkpoint %s result: success=%s", checkpoint_name, results.success)
+        return results
+
+    @staticmethod
+    def _run_validation_definitions(
+        checkpoint: Any,
+        batch_parameters: Mapping[str, Any],
+        run_id: Any,
+        result_format: Any
+    ) -> Any:
+        """Run a checkpoint's validation definitions without running its actions.
+
+        Builds the same CheckpointResult as ``Checkpoint.run``. The stored checkpoint
+        is used as is, because GX refuses to run an edited copy that was never saved.
+        Validation results are still written to the results store, so they can be
+        rendered into Data Docs later.
+        """
+        from great_expectations.checkpoint.checkpoint import CheckpointResult
+        from great_expectations.data_context.types.resource_identifiers import (
+            ExpectationSuiteIdentifier,
+            ValidationResultIdentifier,
+        )
+
+        run_results = {}
+        for validation_definition in checkpoint.validation_definitions:
+            result = validation_definition.run(
+                checkpoint_id=checkpoint.id,
+                batch_parameters=batch_parameters,
+                result_format=result_format,
+                run_id=run_id,
+            )
+            key = ValidationResultIdentifier(
+                expectation_suite_identifier=ExpectationSuiteIdentifier(
+                    name=validation_definition.suite.name
+                ),
+                run_id=run_id,
+                batch_identifier=result.batch_id,
+            )
+            run_results[key] = result
+        return CheckpointResult(run_id=run_id, run_results=run_results, checkpoint_config=checkpoint)
+
+    @_wrap_errors("Failed to run checkpoint '{checkpoint_name}'")
+    def run_checkpoint_summary(self, checkpoint_name: str, run_id: Optional[str] = None) -> Any:
+        """Run a checkpoint with the "BASIC" result format, for callers that only need success.
+
+        The checkpoint's validation definitions are run directly with the lighter
+        result format, so the stored checkpoint is not modified and its actions
+        (such as Data Docs rendering) are not run.
+
+        Args:
+            checkpoint_name: Name of the checkpoint to run.
+            run_id: Optional identifier for the run. If None, a default one will be created.
+
+        Returns:
+            The results of the checkpoint run.
+
+        Raises:
+            ValueError: If checkpoint_name is empty or if the run fails.
+        """
+        _require(checkpoint_name=checkpoint_name)
+
+        self.flush()
+        from great_expectations.core import RunIdentifier
+
+        checkpoint = self.context.checkpoints.get(checkpoint_name)
+        return self._run_validation_definitions(
+            checkpoint,
+            self._checkpoint_batch_parameters(checkpoint),
+            RunIdentifier(run_name=run_id if run_id else f"run_{checkpoint_name}"),
+            {"result_format": "BASIC"},
+        )
+
+    @_wrap_errors("Failed to build Data Docs")
+    def finalize_docs(self) -> Dict[str, str]:
+        """Render Data Docs once for every run made with ``defer_docs=True``.
+
+        Returns:
+            A dict mapping Data Docs site names to their URLs. Empty if no runs
+            were deferred.
+
+        Raises:
+            ValueError: If building the Data Docs fails.
+        """
+        if not self._pending_docs:
+            return {}
+        urls = self.context.build_data_docs(resource_identifiers=self._pending_docs)
+        self._pending_docs = []
+        return urls
+
+    @staticmethod
+    def _fingerprint(df: Any) -> bytes:
+        """Return a digest of the DataFrame's shape, dtypes and values.
+
+        Columns backed by plain NumPy numeric, boolean or datetime arrays are
+        hashed straight from their buffers; only the remaining (object, string,
+        extension) columns go through ``pd.util.hash_pandas_object``.
+        """
+        import numpy as np
+        import pandas as pd
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(df.shape).encode())
+        digest.update(str(list(df.dtypes.astype(str).items())).encode())
+        for _, column in df.items():
+            if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biufcmM":
+                digest.update(np.ascontiguousarray(column.to_numpy()).view(np.uint8).data)
             else:
-                print(f"Checkpoint '{checkpoint_name}' validation succeeded")
-                
+                digest.update(pd.util.hash_pandas_object(column, index=False).to_numpy().data)
+        return digest.digest()
+
+    def _result_cache_key(self, checkpoint: Any, df: Any) -> str:
+        """Hash the DataFrame together with the checkpoint and suite configuration."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._fingerprint(df))
+        # Ids are generated per context, so they are left out to keep keys
+        # stable across processes for the same configuration.
+        configuration = [_without_ids(json.loads(checkpoint.json()))]
+        for validation_definition in checkpoint.validation_definitions:
+            configuration.append(_without_ids(validation_definition.suite.to_json_dict()))
+        digest.update(json.dumps(configuration, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def _load_cached_result(self, cache_key: str, checkpoint: Any) -> Any:
+        """Return a cached checkpoint result from memory or disk, or None.
+
+        Results on disk are rebuilt into a CheckpointResult for checkpoint;
+        unreadable files count as a miss.
+        """
+        from great_expectations.checkpoint.checkpoint import CheckpointResult
+        from great_expectations.core import RunIdentifier
+        from great_expectations.core.expectation_validation_result import (
+            ExpectationSuiteValidationResultSchema,
+        )
+        from great_expectations.data_context.types.resource_identifiers import (
+            ValidationResultIdentifier,
+        )
+
+        results = self._result_cache.get(cache_key)
+        if results is not None:
             return results
+        path = os.path.join(_RESULT_CACHE_DIR, f"{cache_key}.json")
+        try:
+            with open(path, encoding="utf-8") as f:
+                document = json.load(f)
+            schema = ExpectationSuiteValidationResultSchema()
+            results = CheckpointResult(
+                run_id=RunIdentifier(**document["run_id"]),
+                run_results={
+                    ValidationResultIdentifier.from_tuple(tuple(key)): schema.load(result)
+                    for key, result in document["run_results"]
+                },
+                checkpoint_config=checkpoint,
+            )
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            raise ValueError(f"Failed to run checkpoint '{checkpoint_name}': {str(e)}")
+            _logger.warning("Ignoring unreadable cached checkpoint result %s: %s", path, e)
+            return None
+        self._result_cache[cache_key] = results
+        return results
 
-    
+    def _store_cached_result(self, cache_key: str, results: Any) -> None:
+        """Keep a checkpoint result in memory and try to persist it to disk as JSON.
 
+        The file is written under a temporary name and then renamed, so readers
+        never see a partial result.
+        """
+        self._result_cache[cache_key] = results
+        path = os.path.join(_RESULT_CACHE_DIR, f"{cache_key}.json")
+        document = {
+            "run_id": results.run_id.to_json_dict(),
+            "run_results": [
+                [list(key.to_tuple()), result.to_json_dict()]
+                for key, result in results.run_results.items()
+            ],
+        }
+        temp_path = None
+        try:
+            os.makedirs(_RESULT_CACHE_DIR, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=_RESULT_CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(document, f, default=str)
+            os.replace(temp_path, path)
+        except Exception as e:
+            _logger.warning("Could not persist checkpoint result to %s: %s", path, e)
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
 
-    
+    @_wrap_errors("Failed to run checkpoint '{checkpoint_name}' in batches")
+    def run_checkpoint_streaming(
+        self,
+        checkpoint_name: str,
+        chunk_size: int = 200_000,
+        path: Optional[str] = None,
+        results_path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run a checkpoint over row batches instead of the whole DataFrame at once.
+
+        Peak memory is bounded by ``chunk_size`` rows rather than the full dataset.
+        Batches are sliced from ``self.df``, or, when ``path`` is given, streamed
+        from a Parquet/Arrow dataset with ``pyarrow.dataset`` so the dataset never
+        has to fit in memory. Row slices of ``self.df`` keep their original index,
+        so unexpected index lists in the results refer to rows of the full frame.
+
+        Args:
+            checkpoint_name: Name of the checkpoint to run.
+            chunk_size: Number of rows per batch. Defaults to 200_000.
+            path: Optional path of a dataset readable by ``pyarrow.dataset``.
+            results_path: Optional file to which each batch result is appended as a
+                JSON line as soon as it is available. When given, per-batch results
+                are not kept in memory.
+
+        Returns:
+            A dict with the aggregated ``success`` (logical AND over batches), the
+            number of ``batches`` run and, unless ``results_path`` was given, the
+            per-batch ``results``.
+
+        Raises:
+            ValueError: If checkpoint_name is empty, chunk_size is not positive,
+                      or if a run fails.
+        """
+        _require(checkpoint_name=checkpoint_name)
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        if path is not None:
+            import pyarrow.dataset as ds
+
+            frames = (
+                batch.to_pandas()
+                for batch in ds.dataset(path).to_batches(batch_size=chunk_size)
+            )
+        else:
+            frames = (
+                self.df.iloc[start:start + chunk_size]
+                for start in range(0, len(self.df), chunk_size)
+            )
+
+        success = True
+        batch_results: List[Any] = []
+        count = 0
+        results_file = open(results_path, "a", encoding="utf-8") if results_path else None
+        try:
+            for frame in frames:
+                result = self.run_checkpoint(
+                    checkpoint_name,
+                    run_id=f"run_{checkpoint_name}_batch_{count}",
+                    batch_parameters={"dataframe": frame},
+                )
+                success = success and bool(result.success)
+                count += 1
+                if results_file is not None:
+                    results_file.write(json.dumps(result.describe_dict(), default=str) + "\n")
+                    results_file.flush()
+                else:
+                    batch_results.append(result)
+        finally:
+            if results_file is not None:
+                results_file.close()
+
+        summary: Dict[str, Any] = {"success": success, "batches": count}
+        if results_file is None:
+            summary["results"] = batch_results
+        return summary
+
+    def build_pipeline(
+        self,
+        suite_name: str,
+        expectations: List[Any],
+        data_source_name: str,
+        data_asset_name: str,
+        checkpoint_name: str,
+        batch_definition_name: Optional[str] = None,
+        validation_definition_name: Optional[str] = None,
+        **checkpoint_kwargs: Any
+    ) -> Pipeline:
+        """Set up everything needed to run a checkpoint in one call.
+
+        Gets or creates the data source, data asset and batch definition, then
+        creates the suite with all expectations, the validation definition and the
+        checkpoint inside bulk_register, so the suite is written once with its
+        expectations and objects are passed along directly instead of being looked
+        up again by name.
+
+        Args:
+            suite_name: Name of the expectation suite.
+            expectations: The expectations to add to the suite.
+            data_source_name: Name of the data source.
+            data_asset_name: Name of the data asset.
+            checkpoint_name: Name of the checkpoint.
+            batch_definition_name: Optional name of the batch definition.
+                Defaults to "{data_asset_name}_batch".
+            validation_definition_name: Optional name of the validation definition.
+                Defaults to "{suite_name}_validation".
+            **checkpoint_kwargs: Extra arguments for create_checkpoint, such as
+                result_format or render_docs.
+
+        Returns:
+            A Pipeline of the suite, batch definition, validation definition and
+            checkpoint; pass ``pipeline.checkpoint.name`` to run_checkpoint.
+
+        Raises:
+            ValueError: If a required name is empty or if any step fails.
+        """
+        _require(checkpoint_name=checkpoint_name)
+
+        data_source = self.set_data_source(data_source_name)
+        data_asset = self.set_data_asset(data_source, data_asset_name, data_source_name=data_source_name)
+        batch_definition = self.set_batch_definition(
+            batch_definition_name=batch_definition_name or f"{data_asset_name}_batch",
+            data_asset=data_asset
+        )
+
+        with self.bulk_register():
+            suite = self.create_expectation_suite(suite_name)
+            self.add_expectations(expectations, suite=suite)
+            validation_definition = self.create_validation_definition(
+                validation_definition_name=validation_definition_name or f"{suite_name}_validation",
+                suite=suite,
+                batch_definition=batch_definition
+            )
+            checkpoint = self.create_checkpoint(
+                checkpoint_name=checkpoint_name,
+                validation_definition=validation_definition,
+                **checkpoint_kwargs
+            )
+        return Pipeline(suite, batch_definition, validation_definition, checkpoint)
+
+    def run_checkpoints(
+        self,
+        checkpoint_names: List[str],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Run several independent checkpoints concurrently.
+
+        Checkpoint runs are dominated by store and Data Docs I/O and by pandas
+        kernels that release the GIL, so they are dispatched to a thread pool.
+        A failing checkpoint does not abort the batch; its exception is stored
+        in place of its results.
+
+        Args:
+            checkpoint_names: Names of the checkpoints to run.
+            max_workers: Maximum number of worker threads. Defaults to
+                min(32, len(checkpoint_names)).
+
+        Returns:
+            A dict mapping each checkpoint name to its results, or to the
+            exception raised while running it.
+
+        Raises:
+            ValueError: If checkpoint_names is empty.
+        """
+        _require(checkpoint_names=checkpoint_names)
+        return self._run_concurrently(self.run_checkpoint, checkpoint_names, max_workers)
+
+    def run_validations(
+        self,
+        validation_definition_names: List[str],
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Run several independent validation definitions concurrently.
+
+        Args:
+            validation_definition_names: Names of the validation definitions to run.
+            max_workers: Maximum number of worker threads. Defaults to
+                min(32, len(validation_definition_names)).
+
+        Returns:
+            A dict mapping each validation definition name to its results, or to
+            the exception raised while running it.
+
+        Raises:
+            ValueError: If validation_definition_names is empty.
+        """
+        _require(validation_definition_names=validation_definition_names)
+        return self._run_concurrently(self.run_validation, validation_definition_names, max_workers)
+
+    def _run_concurrently(
+        self,
+        run: Callable[[str], Any],
+        names: List[str],
+        max_workers: Optional[int]
+    ) -> Dict[str, Any]:
+        """Call run(name) for each name on a thread pool, collecting results or exceptions."""
+        # Suites are saved once up front rather than racing inside each worker.
+        self.flush()
+        results: Dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(names))) as executor:
+            futures = {executor.submit(run, name): name for name in names}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    results[name] = e
+        return results